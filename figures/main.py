@@ -1,9 +1,18 @@
 import get
 import put
 import sync
+import argparse
 import shutil
 import os
-from utils import setup_style
+from concurrent.futures import ProcessPoolExecutor
+from utils import LOCATIONS, data_path, flush_saves, setup_style
+
+# Every CSV read by the plot modules, as (filename, directory) pairs
+REQUIRED_DATA = [
+    (filename, directory)
+    for filename in ("bw_shmem_get.csv", "bw_shmem_put.csv", "latency.csv")
+    for directory, _ in LOCATIONS
+]
 
 
 def clean_figures_directory():
@@ -20,31 +29,94 @@ def clean_figures_directory():
     os.makedirs("figures", exist_ok=True)
 
 
+def check_data_files():
+    """Verify that every benchmark CSV exists before any figure is created
+
+    Failing here, rather than partway through plotting, avoids a half-regenerated figures
+    directory and lets read_data assume its input is present.
+
+    Raises:
+        FileNotFoundError: Listing every missing CSV
+    """
+    missing = [
+        data_path(filename, directory)
+        for filename, directory in REQUIRED_DATA
+        if not os.path.isfile(data_path(filename, directory))
+    ]
+    if missing:
+        raise FileNotFoundError(f"Missing benchmark data files: {', '.join(missing)}")
+
+
+def run_job(job, color_palette, location):
+    """Run one plot job in a worker process
+
+    Waits for any background saves (FIG_SAVE_WORKERS) so the job only finishes once all of
+    its PDFs are written.
+
+    Args:
+        job (callable): A generate_plots function of one of the plot modules
+        color_palette (list): List of colors for the plots
+        location (tuple): (directory, output_prefix) pair to plot
+    """
+    job(color_palette, locations=(location,))
+    flush_saves()
+
+
 def main():
     """Main entry point for generating benchmark visualization plots
 
     This function orchestrates the entire plot generation process:
-    1. Cleans up any existing figures to avoid mixing old and new plots
-    2. Sets up consistent plotting styles and color schemes
-    3. Generates all benchmark comparison plots:
+    1. Checks that all benchmark CSVs exist, before anything is removed or plotted
+    2. With --force, cleans up any existing figures so every plot is regenerated; otherwise
+       figures that are newer than their CSV and plotting code are kept and skipped
+    3. Sets up consistent plotting styles and color schemes
+    4. Generates all benchmark comparison plots in parallel, one job per module and
+       measurement location (local and network):
        - get operations (latency and bandwidth)
        - put operations (latency and bandwidth)
-       - sync operations (local and network comparisons)
+       - sync operations
 
     The plots compare performance between C, Rust, and Python implementations,
     using data from CSV files in the data directory. All generated plots are 
     saved as PDF files in category-specific subdirectories under ./figures/
     """
-    # Clean up existing figures
-    clean_figures_directory()
+    parser = argparse.ArgumentParser(description="Generate benchmark comparison plots")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="remove all existing figures and regenerate them, even if they are up to date",
+    )
+    args = parser.parse_args()
+
+    # Fail fast on missing inputs
+    check_data_files()
+
+    # Clean up existing figures only when asked to; stale figures are detected per plot
+    if args.force:
+        clean_figures_directory()
+    else:
+        os.makedirs("figures", exist_ok=True)
 
     # Setup the plotting style and get colorblind-friendly palette
     color_palette = setup_style()
 
-    # Generate all benchmark comparison plots
-    get.generate_plots(color_palette)  # Get operation comparisons
-    put.generate_plots(color_palette)  # Put operation comparisons
-    sync.generate_plots(color_palette)  # Sync operations comparisons
+    # Generate all benchmark comparison plots. The modules and locations share no state,
+    # so each (module, location) job runs in its own process (matplotlib is not
+    # thread-safe). Workers re-apply the style because rcParams are not inherited when
+    # processes are spawned.
+    modules = [
+        get,  # Get operation comparisons
+        put,  # Put operation comparisons
+        sync,  # Sync operations comparisons
+    ]
+    jobs = [(module.generate_plots, location) for module in modules for location in LOCATIONS]
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=setup_style) as pool:
+        futures = [
+            pool.submit(run_job, job, color_palette, location) for job, location in jobs
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+from utils import (
+    LOCATIONS,
+    MESSAGE_SIZE_COLUMNS,
+    MESSAGE_SIZE_DTYPES,
+    line_styles,
+    data_path,
+    count_rows,
+    is_up_to_date,
+    read_data,
+    add_bandwidth_columns,
+    columns_to_arrays,
+    plot_cache_key,
+    create_plot,
+    style_plot,
+    save_plot,
+)
+import numpy as np
+
+# (column, implementation) for each plotted series; the implementation keys utils.line_styles
+LATENCY_SERIES = (
+    ("C (raw, us)", "C"),
+    ("RS (raw, us)", "RS"),
+    ("Py (raw, us)", "Py"),
+)
+BANDWIDTH_SERIES = (
+    ("C MiBPS", "C"),
+    ("RS MiBPS", "RS"),
+    ("Py MiBPS", "Py"),
+)
+
+# Fewer message sizes than this (e.g. a smoke-test CSV) make a meaningless log-scale plot
+MIN_LOG_POINTS = 3
+
+
+def output_filename(op, output_prefix, metric, scale):
+    """Build the PDF filename for a get/put plot
+
+    The logarithmic variant keeps the historical name (e.g. get_local_latency.pdf) so existing
+    references to the figures stay valid; any other scale is appended as a suffix
+    (e.g. get_local_latency_linear.pdf).
+
+    Args:
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        output_prefix (str): Either "local" or "net"
+        metric (str): Either "latency" or "bandwidth"
+        scale (str): The y-axis scale of the plot ("log" or "linear")
+
+    Returns:
+        str: The output filename
+    """
+    if scale == "log":
+        return f"{op}_{output_prefix}_{metric}.pdf"
+    return f"{op}_{output_prefix}_{metric}_{scale}.pdf"
+
+
+def plot_series(ax, styles, data, series):
+    """Draw one line per implementation on the axes
+
+    Args:
+        ax (matplotlib.axes.Axes): The axis to draw on
+        styles (dict): Line2D keyword arguments per implementation ("C", "RS", "Py"),
+                       as built by utils.line_styles
+        data (dict): Benchmark columns as NumPy arrays, from columns_to_arrays
+        series (tuple): (column, implementation) pairs, e.g. LATENCY_SERIES
+    """
+    # Draw all implementations in one call, then give each line its own marker and color
+    ys = np.column_stack([data[column] for column, _ in series])
+    lines = ax.plot(data["Msg Size (b)"], ys)
+    for line, (_, implementation) in zip(lines, series):
+        line.set(**styles[implementation])
+
+
+def series_cache_key(op, styles, data, series):
+    """Build the save_plot cache key of a figure drawn by plot_series
+
+    Args:
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        styles (dict): Line2D keyword arguments per implementation, as built by
+                       utils.line_styles
+        data (dict): Benchmark columns as NumPy arrays, from columns_to_arrays
+        series (tuple): (column, implementation) pairs, e.g. LATENCY_SERIES
+
+    Returns:
+        bytes: The cache key
+    """
+    arrays = [data["Msg Size (b)"]] + [data[column] for column, _ in series]
+    return plot_cache_key(arrays, (op, series, styles), sources=(__file__,))
+
+
+def save_scales(fig, ax, op, data, output_prefix, metric, scales, cache_key):
+    """Style and save one figure once per requested y-axis scale
+
+    The lines are drawn only once; between saves only the y-axis scale is switched and the
+    y-limits are re-autoscaled, since style_plot pins them for the previous scale. The figure
+    must not be used after the last save, as the next create_plot call clears and reuses it
+    (see utils.FIG_CACHE). PDFs whose cache key (extended by the scale) is unchanged since
+    they were written are not written again.
+
+    Args:
+        fig (matplotlib.figure.Figure): The figure to save, created with the first scale
+        ax (matplotlib.axes.Axes): The axis holding the plotted lines
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        data (dict): Benchmark columns as NumPy arrays, from columns_to_arrays
+        output_prefix (str): Either "local" or "net"
+        metric (str): Either "latency" or "bandwidth"
+        scales (tuple): Y-axis scales to render ("log" and/or "linear")
+        cache_key (bytes): plot_cache_key of the drawn lines
+    """
+    for i, scale in enumerate(scales):
+        if i:
+            ax.set_yscale(scale)
+            ax.autoscale(axis="y")
+
+        # Style the plot with increased x-axis label rotation to prevent overlap
+        style_plot(ax, data, x_rotation=30)
+
+        save_plot(
+            fig,
+            output_filename(op, output_prefix, metric, scale),
+            op,
+            close=i == len(scales) - 1,
+            cache_key=cache_key + scale.encode(),
+        )
+
+
+def generate_latency_plot(op, styles, data, output_prefix, scales=("log",)):
+    """Generate latency plots for an operation, one per requested y-axis scale
+
+    Creates plots comparing latency between C, Rust, and Python implementations of shmem_get
+    or shmem_put operations. A logarithmic y-axis gives better visualization of performance
+    differences. The figure is built once and re-saved for every scale.
+
+    Args:
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        styles (dict): Line2D keyword arguments per implementation ("C", "RS", "Py"),
+                       as built by utils.line_styles
+        data (dict): Benchmark columns as NumPy arrays, from columns_to_arrays
+        output_prefix (str): Prefix for the output filename, either "local" for same-node
+                           measurements or "net" for network measurements
+        scales (tuple): Y-axis scales to render ("log" and/or "linear"), defaults to log only
+
+    Returns:
+        None. The plots are saved to disk as PDF files.
+    """
+    # Create the plot with the first y-axis scale
+    fig, ax = create_plot(yscale=scales[0])
+
+    plot_series(ax, styles, data, LATENCY_SERIES)
+    ax.set_ylabel("Latency (μs)", labelpad=15)
+
+    cache_key = series_cache_key(op, styles, data, LATENCY_SERIES)
+    save_scales(fig, ax, op, data, output_prefix, "latency", scales, cache_key)
+
+
+def generate_bandwidth_plot(op, styles, data, output_prefix, scales=("log",)):
+    """Generate bandwidth plots for an operation, one per requested y-axis scale
+
+    Creates plots comparing bandwidth between C, Rust, and Python implementations of shmem_get
+    or shmem_put operations. Expects the "C/RS/Py MiBPS" columns computed by
+    add_bandwidth_columns. The figure is built once and re-saved for every scale.
+
+    Args:
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        styles (dict): Line2D keyword arguments per implementation ("C", "RS", "Py"),
+                       as built by utils.line_styles
+        data (dict): Benchmark columns as NumPy arrays, including the bandwidth columns
+        output_prefix (str): Prefix for the output filename, either "local" for same-node
+                           measurements or "net" for network measurements
+        scales (tuple): Y-axis scales to render ("log" and/or "linear"), defaults to log only
+
+    Returns:
+        None. The plots are saved to disk as PDF files.
+    """
+    # Create the plot with the first y-axis scale
+    fig, ax = create_plot(yscale=scales[0])
+
+    plot_series(ax, styles, data, BANDWIDTH_SERIES)
+    ax.set_ylabel("Bandwidth (MiB/s)", labelpad=15)
+
+    cache_key = series_cache_key(op, styles, data, BANDWIDTH_SERIES)
+    save_scales(fig, ax, op, data, output_prefix, "bandwidth", scales, cache_key)
+
+
+def generate_plot_pair(op, color_palette, directory, output_prefix, scales=("log",)):
+    """Generate the latency and bandwidth plots for one data set of an operation
+
+    Reads data/<directory>/bw_shmem_<op>.csv once (only the columns the plots use), derives
+    the bandwidth columns once, and renders both plot kinds from the same set of column arrays.
+    The log scale is skipped, with a notice, for data sets with fewer than MIN_LOG_POINTS
+    message sizes.
+    Nothing is done when all PDFs are already newer than the CSV and the plotting code.
+
+    Args:
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        color_palette (list): List of colors for the plots, expects at least 3 colors:
+                            - color_palette[0] for C implementation
+                            - color_palette[1] for Rust implementation
+                            - color_palette[2] for Python implementation
+        directory (str): Directory containing the data ('intranode' or 'internode')
+        output_prefix (str): Prefix for the output filename, either "local" for same-node
+                           measurements or "net" for network measurements
+        scales (tuple): Y-axis scales to render ("log" and/or "linear"), defaults to log only
+
+    Returns:
+        None. The plots are saved to disk as PDF files.
+    """
+    filename = f"bw_shmem_{op}.csv"
+    filepath = data_path(filename, directory)
+
+    # A log plot of one or two points shows nothing; render only the other scales, if any.
+    # The rows are counted before the up-to-date check, so it never waits on PDFs that are
+    # not going to be written
+    if "log" in scales and count_rows(filepath) < MIN_LOG_POINTS:
+        print(f"Skipping log-scale figures for {filepath}: fewer than {MIN_LOG_POINTS} rows")
+        scales = tuple(scale for scale in scales if scale != "log")
+        if not scales:
+            return
+
+    # Skip the whole pair when neither the CSV nor the plotting code changed since last run
+    outputs = [
+        output_filename(op, output_prefix, metric, scale)
+        for metric in ("latency", "bandwidth")
+        for scale in scales
+    ]
+    if is_up_to_date(outputs, op, [filepath, __file__]):
+        return
+
+    df = read_data(filename, directory, columns=MESSAGE_SIZE_COLUMNS, dtype=MESSAGE_SIZE_DTYPES)
+    data = columns_to_arrays(add_bandwidth_columns(df))
+
+    # Only the column arrays, which own their data, are used from here on; drop the frame
+    # before any figure is built. The frame with the bandwidth columns was never bound, so
+    # it is already gone. Both plots draw on the same reused figure from create_plot.
+    del df
+
+    styles = line_styles(color_palette)
+    generate_latency_plot(op, styles, data, output_prefix, scales)
+    generate_bandwidth_plot(op, styles, data, output_prefix, scales)
+
+
+def generate_plots(op, color_palette, scales=("log",), locations=LOCATIONS):
+    """Generate all plots for one operation
+
+    Generates latency and bandwidth plots for local (intranode) and network (internode)
+    measurements of the operation, saved in 'figures/<op>'. Each location is independent
+    of the others, so main.py renders them in separate worker processes.
+
+    Args:
+        op (str): The OpenSHMEM operation, either "get" or "put"
+        color_palette (list): List of colors for the plots, expects at least 3 colors:
+                            - color_palette[0] for C implementation
+                            - color_palette[1] for Rust implementation
+                            - color_palette[2] for Python implementation
+        scales (tuple): Y-axis scales to render ("log" and/or "linear"), defaults to log only
+        locations (tuple): (directory, output_prefix) pairs to plot, defaults to both the
+                           local (intranode) and network (internode) measurements
+
+    Returns:
+        None. All plots are saved to disk as PDF files.
+    """
+    for directory, output_prefix in locations:
+        generate_plot_pair(op, color_palette, directory, output_prefix, scales)
@@ -1,6 +1,30 @@
-from utils import read_data, create_plot, style_plot, save_plot
+from utils import (
+    LOCATIONS,
+    SYNC_COLUMNS,
+    SYNC_DTYPES,
+    data_path,
+    is_up_to_date,
+    read_data,
+    create_plot,
+    save_plot,
+    plot_cache_key,
+)
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Text settings shared by every percentage label above the bars, as ax.bar_label arguments
+BAR_LABEL_KW = {"fontweight": "bold", "padding": 3}
+
+
+def output_filename(output_prefix):
+    """Build the PDF filename for a sync plot, e.g. sync_local.pdf
+
+    Args:
+        output_prefix (str): Either "local" or "net"
+
+    Returns:
+        str: The output filename
+    """
+    return f"sync_{output_prefix}.pdf"
 
 
 def generate_sync_plot(color_palette, filename, directory, output_prefix):
@@ -17,6 +41,8 @@ def generate_sync_plot(color_palette, filename, directory, output_prefix):
     - Bold labels and legend
     - Logarithmic y-axis scale to better handle extreme values
 
+    Nothing is done when the PDF is already newer than the CSV and the plotting code.
+
     Args:
         color_palette (list): List of colors for the plot, expects at least 3 colors:
                             - color_palette[0] for C implementation
@@ -31,50 +57,76 @@ def generate_sync_plot(color_palette, filename, directory, output_prefix):
     Returns:
         None. The plots are saved to disk as PDF files in the figures/sync directory.
     """
-    # Read data from CSV file
-    df = read_data(filename, directory)
-    if df is None:
+    # Skip the plots when neither the CSV nor the plotting code changed since last run
+    outputs = [output_filename(output_prefix)]
+    if is_up_to_date(outputs, "sync", [data_path(filename, directory), __file__]):
         return
 
-    # Generate logarithmic scale plot
-    generate_sync_plot_log_scale(color_palette, df, output_prefix)
+    # Read only the columns the plot uses, with their types declared up front
+    df = read_data(filename, directory, columns=SYNC_COLUMNS, dtype=SYNC_DTYPES)
 
+    # Create the plot with wider figure for better visibility
+    fig, ax = create_plot(figsize=(12, 6), yscale="log")
+
+    # Derive everything the bars need from the frame once: labels, positions and heights
+    routine_labels = simplify_routine_names(df["Routine"])
+    x = np.arange(len(routine_labels))
+    c_values = np.full(len(routine_labels), 100.0)
+    rs_values = df["RS (normalized)"].to_numpy() * 100
+    py_values = df["Py (normalized)"].to_numpy() * 100
+    del df
+
+    plot_sync_bars(ax, color_palette, x, routine_labels, c_values, rs_values, py_values)
+    cache_key = plot_cache_key(
+        (rs_values, py_values), (tuple(routine_labels), color_palette), sources=(__file__,)
+    )
 
-def generate_sync_plot_log_scale(color_palette, df, output_prefix):
-    """Generate sync plot with logarithmic y-axis scale
+    set_sync_yaxis(ax, rs_values, py_values)
+
+    # Save the plot to the appropriate directory. The wide bar plot keeps its default subplot
+    # layout; tight_layout would squash it vertically under the legend
+    save_plot(
+        fig, output_filename(output_prefix), "sync", tight_layout=False, cache_key=cache_key
+    )
+
+
+def simplify_routine_names(routines):
+    """Shorten routine names for the x-axis labels
+
+    Drops the "shmem_" prefix and shortens atomic_compare_swap to atomic_cswap. Routine is
+    categorical, so the string operations run once per distinct routine rather than per row.
 
     Args:
-        color_palette (list): List of colors for the plot
-        df (pandas.DataFrame): DataFrame containing the data
-        output_prefix (str): Prefix for the output filename
+        routines (pandas.Series): The Routine column
+
+    Returns:
+        numpy.ndarray: One label per routine
     """
-    # Create the plot with wider figure for better visibility
-    fig, ax = create_plot(figsize=(12, 6))
+    return (
+        routines.str.replace(r"^shmem_", "", regex=True)
+        .replace("atomic_compare_swap", "atomic_cswap")
+        .to_numpy()
+    )
 
-    # Set up bar positions with proper spacing
-    routines = df["Routine"].values
-    x = np.arange(len(routines))
-    width = 0.25  # Width of bars for 3 implementations
 
-    # Define simplified labels for the x-axis
-    simplified_labels = []
-    for routine in routines:
-        # Remove "shmem_" prefix and extract the core operation name
-        if routine.startswith("shmem_"):
-            label = routine[6:]  # Remove "shmem_" prefix
-        else:
-            label = routine
-            
-        # Special case for atomic_compare_swap - rename to atomic_cswap
-        if label == "atomic_compare_swap":
-            label = "atomic_cswap"
-            
-        simplified_labels.append(label)
+def plot_sync_bars(ax, color_palette, x, routine_labels, c_values, rs_values, py_values):
+    """Draw the grouped sync bars, their labels and the x-axis
+
+    Args:
+        ax (matplotlib.axes.Axes): The axis to draw on
+        color_palette (list): List of colors for the plot
+        x (numpy.ndarray): Position of each routine's bar group
+        routine_labels (numpy.ndarray): X-axis label of each routine
+        c_values (numpy.ndarray): C bar heights, always 100%
+        rs_values (numpy.ndarray): Rust performance as a percentage of C, one value per routine
+        py_values (numpy.ndarray): Python performance as a percentage of C, one value per routine
+    """
+    width = 0.25  # Width of bars for 3 implementations
 
     # Create bars for C implementation (baseline)
     c_bars = ax.bar(
         x - width,
-        [100] * len(routines),
+        c_values,
         width,
         label="C (baseline)",
         color=color_palette[0],
@@ -82,7 +134,6 @@ def generate_sync_plot_log_scale(color_palette, df, output_prefix):
     )
 
     # Create bars for Rust implementation (as percentage of C)
-    rs_values = df["RS (normalized)"].values * 100
     rs_bars = ax.bar(
         x,
         rs_values,
@@ -93,7 +144,6 @@ def generate_sync_plot_log_scale(color_palette, df, output_prefix):
     )
     
     # Create bars for Python implementation (as percentage of C)
-    py_values = df["Py (normalized)"].values * 100
     py_bars = ax.bar(
         x + width,
         py_values,
@@ -104,85 +154,68 @@ def generate_sync_plot_log_scale(color_palette, df, output_prefix):
     )
 
     # Customize the plot appearance
-    ax.set_ylabel("Percentage (%)", fontsize=14, fontweight="bold", labelpad=15)
+    ax.set_ylabel("Percentage (%)", labelpad=15)
 
     # Set x-axis ticks and labels with rotation to prevent overlap
-    ax.set_xticks(x)
-    ax.set_xticklabels(simplified_labels, rotation=30, fontweight="bold", ha="right")
+    ax.set_xticks(x, labels=routine_labels, rotation=30, fontweight="bold", ha="right")
 
-    # Set logarithmic scale for y-axis
-    ax.set_yscale('log')
-    # Ensure the bottom of the scale is at or slightly below 100%
-    ax.set_ylim(bottom=50)
-    
-    # For log scale, customize tick labels
-    yticks = ax.get_yticks()
-    ax.set_yticklabels([f"{y:.0f}%" for y in yticks], fontweight="bold")
-    
-    # Add percentage labels with adjusted position for log scale
-    add_percentage_labels_log(ax, x, width, df, color_palette, c_bars, rs_bars, py_bars)
+    # Add percentage labels on top of each bar
+    add_percentage_labels(ax, rs_values, py_values, color_palette, c_bars, rs_bars, py_bars)
 
     # Add horizontal grid lines and legend in the top left
     ax.grid(True, axis="y", alpha=0.3)
-    ax.legend(frameon=True, fontsize=14, loc="upper left", prop={"weight": "bold"})
+    ax.legend(prop={"weight": "bold"})
 
-    # Save the plot to the appropriate directory
-    save_plot(fig, f"sync_{output_prefix}.pdf", "sync")
 
+def set_sync_yaxis(ax, rs_values, py_values):
+    """Configure the logarithmic y-axis of a sync plot
 
-def add_percentage_labels_log(ax, x, width, df, color_palette, c_bars, rs_bars, py_bars):
-    """Add percentage labels on top of each bar for logarithmic scale
+    Args:
+        ax (matplotlib.axes.Axes): The axis holding the bars
+        rs_values (numpy.ndarray): Rust performance as a percentage of C, one value per routine
+        py_values (numpy.ndarray): Python performance as a percentage of C, one value per routine
+    """
+    # Ensure the bottom of the (logarithmic) scale is at or slightly below 100%, and low enough
+    # that bars under 50% (and the labels bar_label puts on top of them) stay visible
+    ax.set_ylim(bottom=min(50, 0.8 * min(rs_values.min(), py_values.min())))
+
+    # For log scale, customize tick labels; only ticks inside the limits are pinned, since
+    # set_yticks widens the limits to include every tick it is given
+    ymin, ymax = ax.get_ylim()
+    yticks = ax.get_yticks()
+    yticks = yticks[(yticks >= ymin) & (yticks <= ymax)]
+    ax.set_yticks(yticks, labels=[f"{y:.0f}%" for y in yticks], fontweight="bold")
+
+
+def add_percentage_labels(ax, rs_values, py_values, color_palette, c_bars, rs_bars, py_bars):
+    """Add percentage labels on top of each bar
+
+    Each bar group is labelled with a single ax.bar_label call, which places the text just
+    above the bar tops in screen space and so works unchanged on linear and logarithmic axes.
 
     Args:
         ax (matplotlib.axes.Axes): The axis to add labels to
-        x (numpy.ndarray): X positions for the bars
-        width (float): Width of each bar
-        df (pandas.DataFrame): DataFrame containing the data
+        rs_values (numpy.ndarray): Rust performance as a percentage of C, one value per routine
+        py_values (numpy.ndarray): Python performance as a percentage of C, one value per routine
         color_palette (list): List of colors for the plot
         c_bars (matplotlib.container.BarContainer): C implementation bars
         rs_bars (matplotlib.container.BarContainer): Rust implementation bars
         py_bars (matplotlib.container.BarContainer): Python implementation bars
     """
-    for i in range(len(x)):
-        # Label for C baseline (always 100%)
-        ax.text(
-            x[i] - width,
-            110,  # Place slightly above the bar in log scale
-            "100.00%",
-            ha="center",
-            va="bottom",
-            color=color_palette[0],
-            fontweight="bold",
-        )
-        
-        # Label for Rust implementation (calculated percentage)
-        rs_val = df["RS (normalized)"].values[i] * 100
-        rs_txt = f"{rs_val:.2f}%"
-        ax.text(
-            x[i],
-            rs_val * 1.1,  # Place slightly above the bar
-            rs_txt,
-            ha="center",
-            va="bottom",
-            color=color_palette[1],
-            fontweight="bold",
-        )
-        
-        # Label for Python implementation (calculated percentage)
-        py_val = df["Py (normalized)"].values[i] * 100
-        py_txt = f"{py_val:.2f}%"
-        ax.text(
-            x[i] + width,
-            py_val * 1.1,  # Place slightly above the bar
-            py_txt,
-            ha="center",
-            va="bottom",
-            color=color_palette[2],
-            fontweight="bold",
-        )
-
-
-def generate_plots(color_palette):
+    # Format every label up front so the bar_label calls only place precomputed strings
+    c_labels = ["100.00%"] * len(c_bars)
+    rs_labels = [f"{v:.2f}%" for v in rs_values]
+    py_labels = [f"{v:.2f}%" for v in py_values]
+
+    # Label for C baseline (always 100%)
+    ax.bar_label(c_bars, labels=c_labels, color=color_palette[0], **BAR_LABEL_KW)
+
+    # Labels for the Rust and Python implementations (calculated percentages)
+    ax.bar_label(rs_bars, labels=rs_labels, color=color_palette[1], **BAR_LABEL_KW)
+    ax.bar_label(py_bars, labels=py_labels, color=color_palette[2], **BAR_LABEL_KW)
+
+
+def generate_plots(color_palette, locations=LOCATIONS):
     """Generate all sync-related plots
 
     Creates comparison plots for synchronization operations between C, Rust, and Python
@@ -197,12 +230,11 @@ def generate_plots(color_palette):
                             - color_palette[0] for C implementation
                             - color_palette[1] for Rust implementation
                             - color_palette[2] for Python implementation
+        locations (tuple): (directory, output_prefix) pairs to plot, defaults to both the
+                           local (intranode) and network (internode) measurements
 
     Returns:
         None. All plots are saved to disk as PDF files.
     """
-    # Generate plot for same-node measurements (intranode)
-    generate_sync_plot(color_palette, "latency.csv", "intranode", "local")
-
-    # Generate plot for network measurements (internode)
-    generate_sync_plot(color_palette, "latency.csv", "internode", "net")
+    for directory, output_prefix in locations:
+        generate_sync_plot(color_palette, "latency.csv", directory, output_prefix)